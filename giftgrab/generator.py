@@ -7,11 +7,14 @@ import os
 import re
 import shutil
 from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from html import escape as html_escape
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Callable, Iterable, List, Sequence
 from statistics import median
 
 from .affiliates import affiliate_rel, prepare_affiliate_url
@@ -34,6 +37,10 @@ PROTECTED_FILES = {
 }
 
 _MIN_TIMESTAMP = datetime.min.replace(tzinfo=timezone.utc)
+_MIN_EPOCH = _MIN_TIMESTAMP.timestamp()
+
+# Brand, category, and retailer labels repeat across every card and page.
+_escape_cached = lru_cache(maxsize=2048)(html_escape)
 
 
 _BANNED_PHRASES = ("fresh drops", "active vibes")
@@ -44,6 +51,16 @@ _BEST_FOR_PATTERN = re.compile(
     r"(?i)^best\s+for\s+a\s+(?P<subject>.+?)\s+gifts(?P<tail>.*)$"
 )
 _TITLE_REPLACEMENTS = {"Techy": "Tech"}
+_BANNED_RE = re.compile(
+    "|".join(re.escape(phrase) for phrase in _BANNED_PHRASES), re.IGNORECASE
+)
+_WORD_PATTERN = re.compile(r"[A-Za-z]+")
+_WHITESPACE_RUN = re.compile(r"\s+")
+_TITLE_REPLACEMENT_RES = tuple(
+    (re.compile(rf"\b{source}\b"), target)
+    for source, target in _TITLE_REPLACEMENTS.items()
+)
+_AFF_REL = affiliate_rel()
 
 _PRICE_BUCKETS: tuple[tuple[str, str, float | None, float | None], ...] = (
     ("under-25", "Under $25", None, 25.0),
@@ -53,6 +70,19 @@ _PRICE_BUCKETS: tuple[tuple[str, str, float | None, float | None], ...] = (
     ("200-plus", "$200 & up", 200.0, None),
 )
 
+_CATALOG_CONTROLS_OPEN = "\n".join(
+    [
+        '<section class="product-catalog" data-product-catalog>',
+        '  <div class="product-catalog__controls">',
+        '    <form class="product-filters" data-product-form>',
+        '      <div class="product-filters__fields">',
+        '        <div class="product-filters__group product-filters__group--search">',
+        '          <label class="product-filters__label" for="product-search">Search</label>',
+        '          <input class="product-filters__input" type="search" id="product-search" name="search" placeholder="Search by product, brand, or keyword" autocomplete="off" spellcheck="false" aria-describedby="product-results-summary" data-product-search>',
+        '        </div>',
+    ]
+)
+
 SOURCE_LABELS = {
     "amazon": "Amazon",
     "ebay": "eBay",
@@ -114,11 +144,9 @@ def _fallback_product_copy(product: Product) -> str:
     return " ".join(sentence.strip() for sentence in sentences if sentence).strip()
 
 
+@lru_cache(maxsize=8192)
 def _strip_banned_phrases(text: str) -> str:
-    result = text or ""
-    for phrase in _BANNED_PHRASES:
-        result = re.sub(re.escape(phrase), "", result, flags=re.IGNORECASE)
-    return result.strip()
+    return _BANNED_RE.sub("", text or "").strip()
 
 
 def _apply_stopwords(text: str) -> str:
@@ -134,9 +162,10 @@ def _apply_stopwords(text: str) -> str:
             return word.lower()
         return word
 
-    return re.sub(r"[A-Za-z]+", _lower, text)
+    return _WORD_PATTERN.sub(_lower, text)
 
 
+@lru_cache(maxsize=4096)
 def polish_guide_title(title: str) -> str:
     text = (title or "").strip()
     if not text:
@@ -147,14 +176,15 @@ def polish_guide_title(title: str) -> str:
         subject = match.group("subject").strip()
         tail = match.group("tail") or ""
         text = f"Best {subject} Gifts{tail}"
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WHITESPACE_RUN.sub(" ", text).strip()
     text = title_case(text)
     text = _apply_stopwords(text)
-    for source, target in _TITLE_REPLACEMENTS.items():
-        text = re.sub(rf"\b{source}\b", target, text)
+    for pattern, target in _TITLE_REPLACEMENT_RES:
+        text = pattern.sub(target, text)
     return text.strip()
 
 
+@lru_cache(maxsize=4096)
 def _parse_iso_datetime(value: str) -> datetime:
     try:
         parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
@@ -165,10 +195,18 @@ def _parse_iso_datetime(value: str) -> datetime:
     return parsed.astimezone(timezone.utc)
 
 
+@lru_cache(maxsize=4096)
+def _iso_timestamp(value: str) -> float:
+    return _parse_iso_datetime(value).timestamp()
+
+
 def _format_updated_label(value: str | None) -> str | None:
     if not value:
         return None
-    parsed = _parse_iso_datetime(value)
+    return _updated_label(_parse_iso_datetime(value))
+
+
+def _updated_label(parsed: datetime) -> str | None:
     if parsed <= _MIN_TIMESTAMP:
         return None
     return parsed.strftime("%b %d, %Y")
@@ -178,6 +216,14 @@ def _read_markup(path: Path) -> str:
     return path.read_text(encoding="utf-8").lstrip("\ufeff").strip()
 
 
+_INCLUDE_RES = {
+    include_path: re.compile(
+        rf"(?P<indent>[\t ]*)\{{%\s*include\s+[\"']{re.escape(include_path)}[\"']\s*%\}}"
+    )
+    for include_path in ("partials/header.html", "partials/footer.html")
+}
+
+
 def _apply_includes(template: str) -> str:
     includes = {
         "partials/header.html": _read_markup(HEADER_PATH),
@@ -185,18 +231,18 @@ def _apply_includes(template: str) -> str:
     }
 
     for include_path, markup in includes.items():
-        pattern = re.compile(
-            rf"(?P<indent>[\t ]*)\{{%\s*include\s+[\"']{re.escape(include_path)}[\"']\s*%\}}"
-        )
+        lines = markup.splitlines()
+        indented: dict[str, str] = {}
 
         def _replace(match: re.Match[str]) -> str:
             indent = match.group("indent")
-            lines = markup.splitlines()
-            if not lines:
-                return ""
-            return "\n".join(f"{indent}{line}" if line else "" for line in lines)
+            if indent not in indented:
+                indented[indent] = "\n".join(
+                    f"{indent}{line}" if line else "" for line in lines
+                )
+            return indented[indent]
 
-        template = pattern.sub(_replace, template)
+        template = _INCLUDE_RES[include_path].sub(_replace, template)
 
     return template
 
@@ -208,15 +254,22 @@ BASE_TEMPLATE = _apply_includes(
 
 def _join_with_and(items: Sequence[str]) -> str:
     cleaned = [item for item in items if item]
-    if not cleaned:
+    count = len(cleaned)
+    if not count:
         return ""
-    if len(cleaned) == 1:
+    if count == 1:
         return cleaned[0]
-    if len(cleaned) == 2:
+    if count == 2:
         return f"{cleaned[0]} and {cleaned[1]}"
+    if count == 3:
+        return f"{cleaned[0]}, {cleaned[1]}, and {cleaned[2]}"
     return ", ".join(cleaned[:-1]) + f", and {cleaned[-1]}"
 
 
+def _plural(count: int, singular: str, plural: str) -> str:
+    return singular if count == 1 else plural
+
+
 def _price_in_bucket(price: float | None, minimum: float | None, maximum: float | None) -> bool:
     if price is None:
         return False
@@ -227,31 +280,118 @@ def _price_in_bucket(price: float | None, minimum: float | None, maximum: float
     return True
 
 
+@lru_cache(maxsize=4096)
+def _price_display(
+    price_text: str | None, price: float | None, currency: str | None
+) -> str | None:
+    if price_text or price is None:
+        return price_text
+    currency = (currency or "USD").upper()
+    if currency == "USD":
+        return f"${price:,.2f}"
+    return f"{price:,.2f} {currency}"
+
+
 def _format_price_value(value: float | None) -> str:
     if value is None:
         return ""
     text = f"{value:.2f}"
     return text.rstrip("0").rstrip(".")
 
-_HEAD_SAFE_PATTERN = re.compile(r"\{\{\s*head\|safe\s*\}\}")
-_HEAD_PATTERN = re.compile(r"\{\{\s*head\s*\}\}")
-_CONTENT_SAFE_PATTERN = re.compile(r"\{\{\s*content\|safe\s*\}\}")
-_CONTENT_PATTERN = re.compile(r"\{\{\s*content\s*\}\}")
+
+_BASE_SLOT_PATTERN = re.compile(r"\{\{\s*(head|content)(\|safe)?\s*\}\}")
+
+
+def _split_base_template(template: str) -> tuple[str, tuple[tuple[str, bool, str], ...]]:
+    """Split the base template into its leading text and (slot, safe, text) runs."""
+    pieces = _BASE_SLOT_PATTERN.split(template)
+    slots = tuple(
+        (pieces[index], pieces[index + 1] is not None, pieces[index + 2])
+        for index in range(1, len(pieces), 3)
+    )
+    return pieces[0], slots
+
+
+_BASE_LEAD, _BASE_SLOTS = _split_base_template(BASE_TEMPLATE)
+
+
+_ITEM_LIST_PREFIX = '{"@context":"https://schema.org","@type":"ItemList","name":'
+
+
+def _same_file_stat(source: Path, destination: Path) -> bool:
+    """Return True when ``destination`` looks like an earlier ``copy2`` of ``source``."""
+
+    # Size and mtime only, like rsync's quick check; ``touch -r`` can fool it.
+    try:
+        src = os.stat(source)
+        dst = os.stat(destination)
+    except OSError:
+        return False
+    return src.st_size == dst.st_size and src.st_mtime_ns == dst.st_mtime_ns
+
+
+def _matches_existing(target: Path, data: bytes) -> bool:
+    """Return True when ``target`` already holds exactly ``data``."""
+
+    try:
+        if os.stat(target).st_size != len(data):
+            return False
+        with open(target, "rb") as handle:
+            return handle.read() == data
+    except OSError:
+        return False
+
+
+def _matches_existing_chunks(target: Path, chunks: Iterable[str]) -> bool:
+    """Return True when ``target`` already holds the UTF-8 encoding of ``chunks``."""
+
+    try:
+        with open(target, "rb") as handle:
+            for chunk in chunks:
+                data = chunk.encode("utf-8")
+                if handle.read(len(data)) != data:
+                    return False
+            return not handle.read(1)
+    except OSError:
+        return False
+
+
+def _json_compact(value: object) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _encode_json_ld(payload: dict) -> str | None:
+    try:
+        json_ld = _json_compact(payload)
+    except (TypeError, ValueError):
+        LOGGER.exception("Failed to encode JSON-LD payload")
+        return None
+    return json_ld.replace("</", "<\\/")
+
+
+def _json_script_text(value: object) -> str:
+    """Serialise ``value`` for a ``<script type="application/json">`` body."""
+
+    text = _json_compact(value)
+    return text.replace("</", "<\\/").replace("<!--", "\\u003c!--")
 
 
 def _render_with_base(*, content: str, head: str = "") -> str:
-    html = BASE_TEMPLATE
-    escaped_head = html_escape(head)
-    escaped_content = html_escape(content)
-    html = _HEAD_SAFE_PATTERN.sub(lambda _match: head, html)
-    html = _HEAD_PATTERN.sub(lambda _match: escaped_head, html)
-    html = _CONTENT_SAFE_PATTERN.sub(lambda _match: content, html)
-    html = _CONTENT_PATTERN.sub(lambda _match: escaped_content, html)
-    return html
+    values = {"head": head, "content": content}
+    parts = [_BASE_LEAD]
+    for name, safe, text in _BASE_SLOTS:
+        value = values[name]
+        parts.append(value if safe else html_escape(value))
+        parts.append(text)
+    return "".join(parts)
+
 
 LOGGER = logging.getLogger(__name__)
 
 GUIDE_ITEM_TARGET = 20
+_WRITE_WORKERS = min(8, os.cpu_count() or 4)
+_STREAM_BUFFER_SIZE = 1 << 20
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
 
 
 @dataclass
@@ -365,12 +505,314 @@ def load_settings() -> SiteSettings:
     )
 
 
+_CATALOG_RESULTS_TEMPLATE = """\
+      </div>
+      <div class="product-filters__actions">
+        <button type="reset" class="button button-ghost product-filters__reset">Clear filters</button>
+      </div>
+    </form>
+    <p class="product-filters__summary" id="product-results-summary" data-product-summary aria-live="polite">{summary_text}</p>
+  </div>
+  <section class="feed-section product-catalog__results">
+    <div class="feed-list" data-product-grid data-product-total="{total}">
+{cards}
+    </div>
+  </section>
+  <p class="product-catalog__empty" data-product-empty aria-live="polite" hidden>No products match your filters yet. Try adjusting or clearing the filters.</p>
+</section>"""
+
+_PRODUCTS_INDEX_TEMPLATE = """\
+<section class="page-header">
+<h1>All products</h1>
+<p>Every grabgifts find in one catalog. Use the filters below to zero in on the perfect gift fast.</p>
+</section>
+{catalog}"""
+
+_ABOUT_GUARDRAILS_CARD = (
+    "<article class=\"quality-card\">"
+    "<h3>Editorial guardrails</h3>"
+    "<p>Every pick ships with human-written copy, duplicate scrubbing, and pricing context before it goes live.</p>"
+    "</article>"
+)
+
+_ABOUT_MISSION_CARDS = "\n".join(
+    [
+        (
+            "<article class=\"card\">"
+            "<h3>What you'll find</h3>"
+            f"<p>Each guide showcases {GUIDE_ITEM_TARGET} standout gifts with pricing context, verified imagery, and quick-scan blurbs.</p>"
+            "</article>"
+        ),
+        (
+            "<article class=\"card\">"
+            "<h3>Signals we monitor</h3>"
+            "<p>Release calendars, retailer feeds, review velocity, and community chatter all factor into our selections.</p>"
+            "</article>"
+        ),
+        (
+            "<article class=\"card\">"
+            "<h3>Automation plus humans</h3>"
+            "<p>Scripted pipelines flag promising items while editors trim the noise, rewrite copy, and ensure merchandising stays sharp.</p>"
+            "</article>"
+        ),
+    ]
+)
+
+_ABOUT_TEMPLATE = """\
+<section class="page-header">
+<h1>About grabgifts</h1>
+<p>grabgifts is a small editorial studio tracking giftable finds with automation, data, and a human edit pass.</p>
+</section>
+<section class="quality-section" aria-labelledby="about-highlights">
+<div class="page-header">
+<h2 id="about-highlights">What drives the project</h2>
+<p>Metrics, manual curation, and constant iteration keep the catalog trustworthy.</p>
+</div>
+<div class="quality-grid">
+{stats_cards}
+</div>
+</section>
+<section>
+<div class="page-header">
+<h2>How we work</h2>
+<p>Automation handles the heavy lifting while editors focus on storytelling and product fit.</p>
+</div>
+<div class="grid">
+{mission_cards}
+</div>
+</section>
+<section>
+<div class="page-header">
+<h2>Explore more</h2>
+<p>Jump into the latest guides or learn more about our process.</p>
+</div>
+<ul class="link-list"><li><a href="/guides/">Browse today's guides</a></li><li><a href="/how-we-curate/">See how we curate</a></li><li><a href="/contact/">Reach the team</a></li></ul>
+</section>"""
+
+_CURATION_SIGNALS = "".join(
+    [
+        (
+            "<article class=\"quality-card\">"
+            "<h3>Inventory sweep</h3>"
+            "<p>Marketplace APIs and curated retailer feeds pipe in promising items with pricing, imagery, and metadata.</p>"
+            "</article>"
+        ),
+        (
+            "<article class=\"quality-card\">"
+            "<h3>Signal scoring</h3>"
+            "<p>We weigh release timing, review velocity, price movement, and gifting fit to rank every product candidate.</p>"
+            "</article>"
+        ),
+        (
+            "<article class=\"quality-card\">"
+            "<h3>Editorial pass</h3>"
+            f"<p>Editors fact-check availability, write blurbs, and assemble {GUIDE_ITEM_TARGET}-item lineups ready for syndication.</p>"
+            "</article>"
+        ),
+    ]
+)
+
+_CURATION_GUARDRAILS = "\n".join(
+    [
+        (
+            "<article class=\"card\">"
+            "<h3>Duplication control</h3>"
+            "<p>IDs, URLs, and titles are normalized so repeats never sneak into a guide.</p>"
+            "</article>"
+        ),
+        (
+            "<article class=\"card\">"
+            "<h3>Price monitoring</h3>"
+            "<p>We refresh price data daily and surface shifts that change the recommendation.</p>"
+            "</article>"
+        ),
+        (
+            "<article class=\"card\">"
+            "<h3>Compliance ready</h3>"
+            "<p>Affiliate rel attributes, sponsored disclosures, and JSON-LD ship in every build.</p>"
+            "</article>"
+        ),
+    ]
+)
+
+_CURATION_TIMELINE_ENTRIES = (
+    ("07:00", "Automation syncs pricing, inventory status, and new arrivals."),
+    ("11:00", "Editors review flagged products and slot new standouts into guides."),
+    ("15:00", "Guides regenerate, metadata refreshes, and the static site deploys."),
+)
+
+_CURATION_TIMELINE = "".join(
+    f"<li><time datetime=\"{label}\">{label} UTC</time><span>{description}</span></li>"
+    for label, description in _CURATION_TIMELINE_ENTRIES
+)
+
+_CURATION_TEMPLATE = """\
+<section class="page-header">
+<h1>How we curate</h1>
+<p>{summary_text}. Here's how the workflow runs end to end.</p>
+</section>
+<section class="quality-section" aria-labelledby="curation-steps">
+<div class="page-header">
+<h2 id="curation-steps">Three phases keep quality high</h2>
+<p>Automation narrows the field, scoring ranks the contenders, and editors finalize every recommendation.</p>
+</div>
+<div class="quality-grid">
+{signals}
+</div>
+</section>
+<section>
+<div class="page-header">
+<h2>Daily publishing rhythm</h2>
+<p>Each build runs on a repeatable schedule so updates land like clockwork.</p>
+</div>
+<ul class="timeline">
+{timeline}
+</ul>
+</section>
+<section>
+<div class="page-header">
+<h2>Quality guardrails</h2>
+<p>Checks fire on every run to catch anything that could erode trust.</p>
+</div>
+<div class="grid">
+{guardrails}
+</div>
+</section>
+<section>
+<div class="page-header">
+<h2>Need something else?</h2>
+<p>Reach out if you want to collaborate, request coverage, or surface feedback.</p>
+</div>
+<ul class="link-list"><li><a href="/contact/">Contact the editors</a></li><li><a href="/about/">Learn about grabgifts</a></li></ul>
+</section>"""
+
+_CONTACT_STATIC_LINKS = (
+    "<li><a href=\"/faq/\">Review our FAQ &amp; disclosure</a></li>"
+    "<li><a href=\"/guides/\">Catch today's guides</a></li>"
+)
+
+_CONTACT_SUPPORT_CARDS = "".join(
+    [
+        (
+            "<article class=\"quality-card\">"
+            "<h3>Partnerships &amp; pitches</h3>"
+            "<p>Share launch timelines, exclusive bundles, or affiliate-ready drops you'd like us to evaluate.</p>"
+            "</article>"
+        ),
+        (
+            "<article class=\"quality-card\">"
+            "<h3>Corrections</h3>"
+            "<p>See an item go out of stock or pricing that drifted? Send the details and we will rerun the checks.</p>"
+            "</article>"
+        ),
+        (
+            "<article class=\"quality-card\">"
+            "<h3>Press &amp; inquiries</h3>"
+            "<p>Need a quote about gifting trends or our automation stack? Drop a note and we will respond quickly.</p>"
+            "</article>"
+        ),
+    ]
+)
+
+_CONTACT_EXPECTATIONS_CARDS = "\n".join(
+    [
+        (
+            "<article class=\"card\">"
+            "<h3>Response time</h3>"
+            "<p>We aim to reply within one business day, often sooner when a launch is in motion.</p>"
+            "</article>"
+        ),
+        (
+            "<article class=\"card\">"
+            "<h3>What to include</h3>"
+            "<p>Links, pricing, regional availability, and any embargo dates help us act fast.</p>"
+            "</article>"
+        ),
+    ]
+)
+
+_CONTACT_TEMPLATE = """\
+<section class="page-header">
+<h1>Contact the grabgifts editors</h1>
+<p>We love hearing about new products, partnerships, and feedback from shoppers.</p>
+</section>
+<section class="quality-section" aria-labelledby="contact-topics">
+<div class="page-header">
+<h2 id="contact-topics">How we can help</h2>
+<p>Pick the lane that matches what you need and we will route it to the right editor.</p>
+</div>
+<div class="quality-grid">
+{support_cards}
+</div>
+</section>
+<section>
+<div class="page-header">
+<h2>Reach us quickly</h2>
+<p>Choose the channel that works best for you.</p>
+</div>
+<ul class="link-list">{link_items}</ul>
+</section>
+<section>
+<div class="page-header">
+<h2>Set expectations</h2>
+<p>A little prep goes a long way and keeps the catalog clean.</p>
+</div>
+<div class="grid">
+{expectations_cards}
+</div>
+</section>"""
+
+_FAQ_TEMPLATE = """\
+<h1>Affiliate disclosure</h1>
+<p>GrabGifts may earn commissions from qualifying purchases made through outbound links. We only feature items that fit our curated guides.</p>
+<p>Questions? Contact us at <a href="{contact_href}">{contact_label}</a>.</p>"""
+
+_GUIDES_INDEX_HEADER = "\n".join(
+    [
+        "<section class=\"page-header\">",
+        "<h1>All guides</h1>",
+        "<p>Every grabgifts collection in one place.</p>",
+        "</section>",
+    ]
+)
+
+_CHANGELOG_HEADER = "\n".join(
+    [
+        "<section class=\"page-header\">",
+        "<h1>Live changelog</h1>",
+        "<p>Follow every update we push into grabgifts.</p>",
+        "</section>",
+    ]
+)
+
+_SITEMAP_HEADER = (
+    "<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n"
+    "<urlset xmlns=\"http://www.sitemaps.org/schemas/sitemap/0.9\">\n"
+)
+
+
 class SiteGenerator:
     def __init__(self, output_dir: Path | str = Path("public"), settings: SiteSettings | None = None) -> None:
         self.output_dir = Path(output_dir)
         self.settings = settings or load_settings()
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self._sitemap_entries: List[tuple[str, str]] = []
+        self._write_pool: ThreadPoolExecutor | None = None
+        self._pending_writes: dict[Path, Future[None]] = {}
+        self._ready_dirs: dict[Path, Path] = {}
+        self._preview_cards: dict[int, str | None] = {}
+        self._cards: dict[int, tuple[str, str | None] | None] = {}
+        self._descriptions: dict[int, str] = {}
+        self._product_ld: dict[int, str | None] = {}
+        self._affiliate_urls: dict[tuple[str, str | None], str] = {}
+        self._guide_latest: dict[int, str | None] = {}
+        self._product_urls: dict[int, str] = {}
+        self._list_items: dict[int, str] = {}
+        self._title_suffix_html = html_escape(f" – {self.settings.name}")
+        self._abs_base = (self.settings.base_url or "https://example.com").rstrip("/")
+        # Stamped by build() so every page in one build shares the same clock.
+        self._build_now: datetime | None = None
+        self._build_now_iso: str | None = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -379,23 +821,54 @@ class SiteGenerator:
         LOGGER.info("Rendering site to %s", self.output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self._sitemap_entries = []
-        self._copy_static_assets()
-        self._write_homepage(guides, products)
-        self._write_guides(guides)
-        self._write_categories(products)
-        self._write_products(products)
-        self._write_products_index(products)
-        self._write_about(guides, products)
-        self._write_curation_page(guides, products)
-        self._write_contact()
-        self._write_faq()
-        self._write_sitemap()
-        self._write_robots()
-        self._write_rss(guides)
+        self._pending_writes = {}
+        self._ready_dirs = {}
+        self._reset_caches()
+        self._build_now = datetime.now(timezone.utc)
+        self._build_now_iso = self._build_now.isoformat()
+        # Page files are independent, so hand them to a small pool and keep
+        # rendering the next page while the previous one hits the disk.
+        with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as pool:
+            self._write_pool = pool
+            try:
+                self._copy_static_assets()
+                self._write_homepage(guides, products)
+                self._write_guides(guides)
+                self._write_categories(products)
+                self._write_products(products)
+                self._write_products_index(products)
+                self._write_about(guides, products)
+                self._write_curation_page(guides, products)
+                self._write_contact()
+                self._write_faq()
+                self._write_sitemap()
+                self._write_robots()
+                self._write_rss(guides)
+            except BaseException:
+                self._finish_writes(raise_errors=False)
+                raise
+            else:
+                self._finish_writes()
+            finally:
+                self._write_pool = None
+                self._reset_caches()
 
     # ------------------------------------------------------------------
     # Rendering helpers
 
+    def _reset_caches(self) -> None:
+        """Drop per-build render caches."""
+
+        # Keyed by id(), so they must not outlive the sequences given to build().
+        self._preview_cards = {}
+        self._cards = {}
+        self._descriptions = {}
+        self._product_ld = {}
+        self._affiliate_urls = {}
+        self._guide_latest = {}
+        self._product_urls = {}
+        self._list_items = {}
+
     def _copy_static_assets(self) -> None:
         assets_source = ROOT_DIR / "data" / "assets"
         if not assets_source.exists():
@@ -408,6 +881,8 @@ class SiteGenerator:
                 continue
             relative = source.relative_to(assets_source)
             destination = assets_target / relative
+            if _same_file_stat(source, destination):
+                continue
             destination.parent.mkdir(parents=True, exist_ok=True)
             shutil.copy2(source, destination)
 
@@ -535,27 +1010,88 @@ class SiteGenerator:
         return "\n".join(section_parts)
 
     def _abs_url(self, path: str) -> str:
-        base = (self.settings.base_url or "https://example.com").rstrip("/")
         if path.startswith("/"):
-            return f"{base}{path}"
-        return f"{base}/{path}"
+            return f"{self._abs_base}{path}"
+        return f"{self._abs_base}/{path}"
 
     def _adsense_unit(self, slot: str | None) -> str:
         return ""
 
-    def _safe_write(self, target: Path, content: str) -> None:
-        resolved = target.resolve()
+    def _prepare_target(self, target: Path) -> None:
+        parent = target.parent
+        resolved_parent = self._ready_dirs.get(parent)
+        if resolved_parent is None:
+            parent.mkdir(parents=True, exist_ok=True)
+            resolved_parent = self._ready_dirs[parent] = parent.resolve()
+        # Only a symlinked file can point somewhere its directory does not.
+        if os.path.islink(target):
+            resolved = target.resolve()
+        else:
+            resolved = resolved_parent / target.name
         if resolved in PROTECTED_FILES:
             raise RuntimeError("Protected layout file")
-        target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_text(content, encoding="utf-8")
+
+    def _safe_write(self, target: Path, content: str) -> None:
+        self._prepare_target(target)
+        encoded = content.encode("utf-8")
+        if _matches_existing(target, encoded):
+            return
+        data = memoryview(encoded)
+        fd = os.open(target, _WRITE_FLAGS, 0o666)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+    def _safe_write_chunks(
+        self, target: Path, chunks: Sequence[str], *, skip_unchanged: bool = True
+    ) -> None:
+        """Write pre-rendered ``chunks`` to ``target`` without joining them."""
+
+        self._prepare_target(target)
+        if skip_unchanged and _matches_existing_chunks(target, chunks):
+            return
+        with open(
+            target, "w", encoding="utf-8", newline="", buffering=_STREAM_BUFFER_SIZE
+        ) as handle:
+            handle.writelines(chunks)
 
     def _write_file(self, path: str, content: str) -> None:
         file_path = self.output_dir / path.lstrip("/")
         if file_path.name != "index.html":
             file_path = file_path / "index.html"
-        self._safe_write(file_path, content)
+        self._submit_write(self._safe_write, file_path, content)
 
+    def _submit_write(
+        self, writer: Callable[..., None], target: Path, *args: object, **kwargs: object
+    ) -> None:
+        if self._write_pool is None:
+            writer(target, *args, **kwargs)
+            return
+        # Two slugs can map to the same file; wait for the earlier write so
+        # the last submission still wins, as it did when writes were serial.
+        previous = self._pending_writes.pop(target, None)
+        if previous is not None:
+            previous.result()
+        self._pending_writes[target] = self._write_pool.submit(
+            writer, target, *args, **kwargs
+        )
+
+    def _finish_writes(self, *, raise_errors: bool = True) -> None:
+        """Wait for queued writes, logging every failure and re-raising the first."""
+
+        pending, self._pending_writes = self._pending_writes, {}
+        first_error: BaseException | None = None
+        for target, future in pending.items():
+            error = future.exception()
+            if error is None:
+                continue
+            LOGGER.error("Failed to write %s", target, exc_info=error)
+            if first_error is None:
+                first_error = error
+        if raise_errors and first_error is not None:
+            raise first_error
 
     def _render_document(
         self,
@@ -564,70 +1100,74 @@ class SiteGenerator:
         description: str,
         canonical_path: str,
         body: str,
-        extra_json_ld: Iterable[dict] | None = None,
+        extra_json_ld: Iterable[dict | str] | None = None,
+        with_site_name: bool = False,
     ) -> str:
         head_parts: list[str] = []
-        title_text = (page_title or "").strip()
-        if title_text:
-            head_parts.append(f"<title>{html_escape(title_text)}</title>")
+        if with_site_name:
+            title_html = (html_escape(page_title or "") + self._title_suffix_html).strip()
+        else:
+            title_html = html_escape((page_title or "").strip())
+        if title_html:
+            head_parts.append(f"<title>{title_html}</title>")
 
         description_text = (description or "").strip()
         if description_text:
             head_parts.append(
-                "<meta name=\"description\" content=\""
-                + html_escape(description_text)
-                + "\">"
+                f"<meta name=\"description\" content=\"{html_escape(description_text)}\">"
             )
 
         canonical = (canonical_path or "").strip()
         if canonical:
             head_parts.append(
-                "<link rel=\"canonical\" href=\""
-                + html_escape(self._abs_url(canonical))
-                + "\">"
+                f"<link rel=\"canonical\" href=\"{html_escape(self._abs_url(canonical))}\">"
             )
 
         for payload in extra_json_ld or ():
             if not payload:
                 continue
-            try:
-                json_ld = json.dumps(payload, ensure_ascii=False)
-            except (TypeError, ValueError):
-                LOGGER.exception("Failed to encode JSON-LD payload")
+            json_ld = payload if isinstance(payload, str) else _encode_json_ld(payload)
+            if json_ld is None:
                 continue
-            json_ld = json_ld.replace("</", "<\\/")
-            head_parts.append(
-                "<script type=\"application/ld+json\">"
-                + json_ld
-                + "</script>"
-            )
+            head_parts.append(f"<script type=\"application/ld+json\">{json_ld}</script>")
 
-        head_html = ""
-        if head_parts:
-            head_lines = [head_parts[0]]
-            head_lines.extend(f"  {part}" for part in head_parts[1:])
-            head_html = "\n".join(head_lines)
+        head_html = "\n  ".join(head_parts)
 
         body_html = body if body.endswith("\n") else f"{body}\n"
         return _render_with_base(content=body_html, head=head_html)
 
-    def _guide_json_ld(self, guide: Guide, canonical_path: str) -> dict:
-        title = polish_guide_title(guide.title)
-        return {
-            "@context": "https://schema.org",
-            "@type": "ItemList",
-            "name": title,
-            "itemListElement": [
-                {
-                    "@type": "ListItem",
-                    "position": index + 1,
-                    "name": product.title,
-                    "url": self._abs_url(f"/products/{product.slug}/"),
-                }
-                for index, product in enumerate(guide.products)
-            ],
-            "url": self._abs_url(canonical_path),
-        }
+    def _guide_json_ld(self, guide: Guide, canonical_path: str) -> str:
+        return self._item_list_json_ld(
+            polish_guide_title(guide.title),
+            guide.products,
+            url=self._abs_url(canonical_path),
+        )
+
+    def _item_list_json_ld(
+        self, name: str, products: Sequence[Product], url: str | None = None
+    ) -> str:
+        """Encode a schema.org ItemList from a fixed skeleton and cached item fields."""
+
+        fields = self._list_item_fields
+        elements = ",".join(
+            f'{{"@type":"ListItem","position":{position},{fields(product)}}}'
+            for position, product in enumerate(products, start=1)
+        )
+        url_field = f',"url":{_json_compact(url)}' if url is not None else ""
+        json_ld = (
+            f"{_ITEM_LIST_PREFIX}{_json_compact(name)}"
+            f',"itemListElement":[{elements}]{url_field}}}'
+        )
+        return json_ld.replace("</", "<\\/")
+
+    def _list_item_fields(self, product: Product) -> str:
+        key = id(product)
+        if key not in self._list_items:
+            self._list_items[key] = (
+                f'"name":{_json_compact(product.title)}'
+                f',"url":{_json_compact(self._product_abs_url(product))}'
+            )
+        return self._list_items[key]
 
     def _product_json_ld(self, product: Product, description: str) -> dict:
         payload = {
@@ -656,59 +1196,81 @@ class SiteGenerator:
             }
         return payload
 
-    def _product_card(self, product: Product) -> tuple[str, dict] | None:
+    def _affiliate_url(self, product: Product) -> str:
+        key = (product.url, product.source)
+        if key not in self._affiliate_urls:
+            self._affiliate_urls[key] = prepare_affiliate_url(product.url, product.source)
+        return self._affiliate_urls[key]
+
+    def _product_json_ld_text(self, product: Product, description: str) -> str | None:
+        key = id(product)
+        if key not in self._product_ld:
+            self._product_ld[key] = _encode_json_ld(
+                self._product_json_ld(product, description)
+            )
+        return self._product_ld[key]
+
+    def _product_description(self, product: Product) -> str:
+        key = id(product)
+        if key not in self._descriptions:
+            source = product.description or _fallback_product_copy(product)
+            self._descriptions[key] = _strip_banned_phrases(source)
+        return self._descriptions[key]
+
+    def _product_card(self, product: Product) -> tuple[str, str | None] | None:
+        key = id(product)
+        if key not in self._cards:
+            self._cards[key] = self._build_product_card(product)
+        return self._cards[key]
+
+    def _build_product_card(self, product: Product) -> tuple[str, str | None] | None:
         if not product.image:
             return None
-        description_source = product.description or _fallback_product_copy(product)
-        description = _strip_banned_phrases(description_source)
-        link = prepare_affiliate_url(product.url, product.source)
-        price_display = product.price_text
-        if not price_display and product.price is not None:
-            currency = product.currency or "USD"
-            if currency.upper() == "USD":
-                price_display = f"${product.price:,.2f}"
-            else:
-                price_display = f"{product.price:,.2f} {currency.upper()}"
+        description = self._product_description(product)
+        link = self._affiliate_url(product)
+        price_display = _price_display(
+            product.price_text, product.price, product.currency
+        )
         meta_parts = []
         if product.brand:
             meta_parts.append(product.brand)
         if product.category:
             meta_parts.append(product.category)
-        body = ["<article class=\"card\">"]
-        body.append(
+        price_html = f"<p class=\"price\">{price_display}</p>" if price_display else ""
+        meta_html = f"<p>{' • '.join(meta_parts)}</p>" if meta_parts else ""
+        card = (
+            "<article class=\"card\">"
             f"<img src=\"{product.image}\" alt=\"{product.title}\" loading=\"lazy\">"
+            f"<h2>{product.title}</h2>"
+            f"{price_html}"
+            f"{meta_html}"
+            f"<p>{description}</p>"
+            f"<a class=\"button\" rel=\"{_AFF_REL}\" target=\"_blank\" href=\"{link}\">See details</a>"
+            "</article>"
         )
-        body.append(f"<h2>{product.title}</h2>")
-        if price_display:
-            body.append(f"<p class=\"price\">{price_display}</p>")
-        if meta_parts:
-            body.append(f"<p>{' • '.join(meta_parts)}</p>")
-        body.append(f"<p>{description}</p>")
-        body.append(
-            f"<a class=\"button\" rel=\"{affiliate_rel()}\" target=\"_blank\" href=\"{link}\">See details</a>"
-        )
-        body.append("</article>")
-        return "".join(body), self._product_json_ld(product, description)
+        return card, self._product_json_ld_text(product, description)
 
     def _product_preview_card(self, product: Product) -> str | None:
+        key = id(product)
+        if key not in self._preview_cards:
+            self._preview_cards[key] = self._build_preview_card(product)
+        return self._preview_cards[key]
+
+    def _build_preview_card(self, product: Product) -> str | None:
         if not product.title or not product.image:
             return None
-        price_display = product.price_text
-        if not price_display and product.price is not None:
-            currency = product.currency or "USD"
-            if currency.upper() == "USD":
-                price_display = f"${product.price:,.2f}"
-            else:
-                price_display = f"{product.price:,.2f} {currency.upper()}"
+        price_display = _price_display(
+            product.price_text, product.price, product.currency
+        )
         raw_title = product.title or ""
         raw_brand = product.brand or ""
         raw_category = product.category or ""
         description = product.description or ""
         meta_parts: list[str] = []
         if raw_category:
-            meta_parts.append(html_escape(raw_category))
+            meta_parts.append(_escape_cached(raw_category))
         if raw_brand:
-            meta_parts.append(html_escape(raw_brand))
+            meta_parts.append(_escape_cached(raw_brand))
         meta_html = (
             "<p class=\"feed-card-meta\">" + " • ".join(meta_parts) + "</p>"
             if meta_parts
@@ -727,35 +1289,24 @@ class SiteGenerator:
         ).lower()
         keywords_attr = html_escape(keywords[:600])
         category_slug = slugify(raw_category) if raw_category else ""
-        category_attr = html_escape(category_slug)
-        brand_attr = html_escape(raw_brand.lower())
+        category_attr = _escape_cached(category_slug)
+        brand_attr = _escape_cached(raw_brand.lower())
         title_attr = html_escape(raw_title.lower())
         price_attr = (
             f"{product.price:.2f}"
             if product.price is not None
             else ""
         )
-        attributes = [
-            'class="feed-card"',
-            'data-home-product-card="true"',
-            'data-product-card="true"',
-        ]
-        if product.id:
-            attributes.append(f'data-product-id="{html_escape(product.id)}"')
-        attributes.append(f'data-product-title="{title_attr}"')
-        attributes.append(f'data-product-brand="{brand_attr}"')
-        attributes.append(
-            f'data-product-category="{category_attr}"'
-            if category_attr
-            else 'data-product-category=""'
-        )
-        attributes.append(
-            f'data-product-price="{price_attr}"'
-            if price_attr
-            else 'data-product-price=""'
+        id_attr = f' data-product-id="{html_escape(product.id)}"' if product.id else ""
+        attr_html = (
+            'class="feed-card" data-home-product-card="true" data-product-card="true"'
+            f"{id_attr}"
+            f' data-product-title="{title_attr}"'
+            f' data-product-brand="{brand_attr}"'
+            f' data-product-category="{category_attr}"'
+            f' data-product-price="{price_attr}"'
+            f' data-product-keywords="{keywords_attr}"'
         )
-        attributes.append(f'data-product-keywords="{keywords_attr}"')
-        attr_html = " ".join(attributes)
         slug = html_escape(product.slug)
         image = html_escape(product.image)
         title = html_escape(raw_title)
@@ -772,6 +1323,24 @@ class SiteGenerator:
             "</article>"
         )
 
+    def _product_abs_url(self, product: Product) -> str:
+        key = id(product)
+        if key not in self._product_urls:
+            self._product_urls[key] = self._abs_url(f"/products/{product.slug}/")
+        return self._product_urls[key]
+
+    def _guide_latest_iso(self, guide: Guide) -> str | None:
+        """Return the newest product ``updated_at`` in ``guide``, if any."""
+
+        key = id(guide)
+        if key not in self._guide_latest:
+            self._guide_latest[key] = (
+                max(product.updated_at for product in guide.products)
+                if guide.products
+                else None
+            )
+        return self._guide_latest[key]
+
     def _guide_summary(self, guide: Guide) -> str | None:
         products = [product for product in guide.products if product]
         if not products:
@@ -810,7 +1379,7 @@ class SiteGenerator:
                 "</li>"
             )
         brands = sorted(
-            {html_escape(product.brand.strip()) for product in products if product.brand and product.brand.strip()}
+            {_escape_cached(product.brand.strip()) for product in products if product.brand and product.brand.strip()}
         )
         if brands:
             if len(brands) <= 3:
@@ -824,7 +1393,7 @@ class SiteGenerator:
                 "</li>"
             )
         categories = sorted(
-            {html_escape(product.category.strip()) for product in products if product.category and product.category.strip()}
+            {_escape_cached(product.category.strip()) for product in products if product.category and product.category.strip()}
         )
         if categories:
             if len(categories) <= 3:
@@ -839,7 +1408,7 @@ class SiteGenerator:
             )
         sources = sorted(
             {
-                html_escape(SOURCE_LABELS.get(product.source, product.source.title()))
+                _escape_cached(SOURCE_LABELS.get(product.source, product.source.title()))
                 for product in products
                 if product.source
             }
@@ -864,9 +1433,9 @@ class SiteGenerator:
             ]
         )
 
-    def _guide_body(self, guide: Guide) -> tuple[str, List[dict]]:
+    def _guide_body(self, guide: Guide) -> tuple[str, List[str]]:
         cards_html = []
-        json_ld: List[dict] = []
+        json_ld: List[str] = []
         guide_title = polish_guide_title(guide.title)
         for product in guide.products:
             card = self._product_card(product)
@@ -874,23 +1443,24 @@ class SiteGenerator:
                 continue
             card_html, payload = card
             cards_html.append(card_html)
-            json_ld.append(payload)
-        cards = "\n".join(cards_html)
+            if payload:
+                json_ld.append(payload)
         guide_description = _strip_banned_phrases(guide.description)
-        parts = [
-            "<section class=\"page-header\">",
-            f"<h1>{guide_title}</h1>",
-            f"<p>{guide_description}</p>",
-            "</section>",
-        ]
         summary = self._guide_summary(guide)
-        if summary:
-            parts.append(summary)
-        if cards:
-            parts.append(f"<section class=\"grid\">{cards}</section>")
+        summary_html = f"{summary}\n" if summary else ""
+        if cards_html:
+            listing_html = "<section class=\"grid\">" + "\n".join(cards_html) + "</section>"
         else:
-            parts.append("<p>No items are available for this guide right now.</p>")
-        return "\n".join(parts), json_ld
+            listing_html = "<p>No items are available for this guide right now.</p>"
+        body = (
+            "<section class=\"page-header\">\n"
+            f"<h1>{guide_title}</h1>\n"
+            f"<p>{guide_description}</p>\n"
+            "</section>\n"
+            f"{summary_html}"
+            f"{listing_html}"
+        )
+        return body, json_ld
 
     def _write_homepage(
         self, guides: Sequence[Guide], products: Sequence[Product]
@@ -917,19 +1487,19 @@ class SiteGenerator:
                     _parse_iso_datetime(product.updated_at),
                 )
             )
-        if timestamps:
-            last_updated = max(timestamps).isoformat()
-        else:
-            last_updated = datetime.now(timezone.utc).isoformat()
-        updated_label = _format_updated_label(last_updated)
-        sorted_guides = sorted(
-            guides,
-            key=lambda item: (
-                _parse_iso_datetime(item.created_at),
-                polish_guide_title(item.title).lower(),
-            ),
-            reverse=True,
-        )
+        latest = max(timestamps) if timestamps else self._build_now
+        last_updated = latest.isoformat()
+        updated_label = _updated_label(latest)
+        decorated_guides = [
+            (
+                _parse_iso_datetime(guide.created_at),
+                polish_guide_title(guide.title).lower(),
+                guide,
+            )
+            for guide in guides
+        ]
+        decorated_guides.sort(key=itemgetter(0, 1), reverse=True)
+        sorted_guides = [guide for _, _, guide in decorated_guides]
         live_guides = [guide for guide in sorted_guides if guide.products]
         guides_live_count = len(live_guides)
         total_products = len(products)
@@ -1067,9 +1637,9 @@ class SiteGenerator:
                 )
             )
         if top_categories:
-            escaped_categories = [html_escape(name) for name in top_categories]
+            escaped_categories = [_escape_cached(name) for name in top_categories]
             categories_text = _join_with_and(escaped_categories)
-            verb = "are" if len(escaped_categories) > 1 else "is"
+            verb = _plural(len(escaped_categories), "is", "are")
             quality_cards.append(
                 (
                     "<article class=\"quality-card\">"
@@ -1129,22 +1699,23 @@ class SiteGenerator:
             if (product.source or "").lower() == "ebay"
         ]
         if ebay_products:
-            cutoff = datetime.now(timezone.utc) - timedelta(days=1)
-
-            def _recency(product: Product) -> tuple[datetime, str]:
-                created = _parse_iso_datetime(product.created_at)
-                updated = _parse_iso_datetime(product.updated_at)
-                latest = max(created, updated)
-                title_key = (product.title or "").lower()
-                return latest, title_key
-
-            sorted_ebay = sorted(
-                ebay_products,
-                key=lambda item: _recency(item),
-                reverse=True,
-            )
+            cutoff = self._build_now - timedelta(days=1)
+
+            decorated_ebay = [
+                (
+                    max(
+                        _parse_iso_datetime(product.created_at),
+                        _parse_iso_datetime(product.updated_at),
+                    ),
+                    (product.title or "").lower(),
+                    product,
+                )
+                for product in ebay_products
+            ]
+            decorated_ebay.sort(key=itemgetter(0, 1), reverse=True)
+            sorted_ebay = [product for _, _, product in decorated_ebay]
             recent_ebay = [
-                product for product in sorted_ebay if _recency(product)[0] >= cutoff
+                product for newest, _, product in decorated_ebay if newest >= cutoff
             ]
             display_pool = recent_ebay or sorted_ebay
             recent_cards: list[str] = []
@@ -1199,17 +1770,19 @@ class SiteGenerator:
 
         product_cards_initial: list[str] = []
         product_cards_remaining: list[str] = []
-        for product in sorted(
-            products,
-            key=lambda item: (
+        decorated_products = [
+            (
                 max(
-                    _parse_iso_datetime(item.created_at),
-                    _parse_iso_datetime(item.updated_at),
+                    _iso_timestamp(product.created_at),
+                    _iso_timestamp(product.updated_at),
                 ),
-                item.title.lower() if item.title else "",
-            ),
-            reverse=True,
-        ):
+                product.title.lower() if product.title else "",
+                product,
+            )
+            for product in products
+        ]
+        decorated_products.sort(key=itemgetter(0, 1), reverse=True)
+        for _, _, product in decorated_products:
             if product.id in highlighted_ids:
                 continue
             card = self._product_preview_card(product)
@@ -1236,7 +1809,7 @@ class SiteGenerator:
                     [
                         '<div class="feed-sentinel" data-product-sentinel></div>',
                         '<script type="application/json" data-product-source>'
-                        + html_escape(json.dumps(product_cards_remaining))
+                        + _json_script_text(product_cards_remaining)
                         + '</script>',
                     ]
                 )
@@ -1273,34 +1846,30 @@ class SiteGenerator:
             page_description = _strip_banned_phrases(guide.description)
             ld_objects = [self._guide_json_ld(guide, f"/guides/{guide.slug}/")] + product_json_ld
             html = self._render_document(
-                page_title=f"{display_title} – {self.settings.name}",
+                page_title=display_title,
+                with_site_name=True,
                 description=page_description,
                 canonical_path=f"/guides/{guide.slug}/",
                 body=body,
                 extra_json_ld=ld_objects,
             )
             self._write_file(f"/guides/{guide.slug}/index.html", html)
-            if guide.products:
-                latest = max(product.updated_at for product in guide.products)
-            else:
-                latest = datetime.now(timezone.utc).isoformat()
-            self._sitemap_entries.append((f"/guides/{guide.slug}/", latest))
+        self._sitemap_entries.extend(
+            (f"/guides/{guide.slug}/", self._guide_latest_iso(guide) or self._build_now_iso)
+            for guide in guides
+        )
         self._write_guides_index(guides)
         self._write_surprise_page(guides)
         self._write_changelog(guides)
 
     def _write_guides_index(self, guides: Sequence[Guide]) -> None:
-        header = [
-            "<section class=\"page-header\">",
-            "<h1>All guides</h1>",
-            "<p>Every grabgifts collection in one place.</p>",
-            "</section>",
-        ]
         cards = []
-        for guide in sorted(
-            guides, key=lambda item: polish_guide_title(item.title).lower()
-        ):
+        decorated: list[tuple[str, str, Guide]] = []
+        for guide in guides:
             display_title = polish_guide_title(guide.title)
+            decorated.append((display_title.lower(), display_title, guide))
+        decorated.sort(key=itemgetter(0))
+        for _, display_title, guide in decorated:
             first = guide.products[0] if guide.products else None
             teaser = blurb(first) if first else guide.description
             teaser = _strip_banned_phrases(teaser)
@@ -1310,25 +1879,19 @@ class SiteGenerator:
                 f"<p>{teaser}</p>"
                 "</article>"
             )
-        body_parts = header[:]
         if cards:
-            body_parts.extend(
-                [
-                    "<div class=\"grid\">",
-                    "\n".join(cards),
-                    "</div>",
-                ]
-            )
+            listing_html = "<div class=\"grid\">\n" + "\n".join(cards) + "\n</div>"
         else:
-            body_parts.append("<p>No guides are available right now.</p>")
+            listing_html = "<p>No guides are available right now.</p>"
         html = self._render_document(
-            page_title=f"Guides – {self.settings.name}",
+            page_title="Guides",
+            with_site_name=True,
             description="Browse every GrabGifts guide.",
             canonical_path="/guides/",
-            body="\n".join(body_parts),
+            body=f"{_GUIDES_INDEX_HEADER}\n{listing_html}",
         )
         self._write_file("/guides/index.html", html)
-        self._sitemap_entries.append(("/guides/", datetime.now(timezone.utc).isoformat()))
+        self._sitemap_entries.append(("/guides/", self._build_now_iso))
 
     def _write_surprise_page(self, guides: Sequence[Guide]) -> None:
         guide_links = [
@@ -1361,33 +1924,21 @@ class SiteGenerator:
         else:
             body_parts.append("<p>No guides are available right now. Check back soon.</p>")
         html = self._render_document(
-            page_title=f"Spin up a surprise – {self.settings.name}",
+            page_title="Spin up a surprise",
+            with_site_name=True,
             description="Jump to a random GrabGifts guide.",
             canonical_path="/surprise/",
             body="\n".join(body_parts),
         )
         self._write_file("/surprise/index.html", html)
-        self._sitemap_entries.append(("/surprise/", datetime.now(timezone.utc).isoformat()))
+        self._sitemap_entries.append(("/surprise/", self._build_now_iso))
 
     def _write_changelog(self, guides: Sequence[Guide]) -> None:
         entries: List[tuple[datetime, Guide]] = []
         for guide in guides:
-            if guide.products:
-                latest = max(product.updated_at for product in guide.products)
-            else:
-                latest = guide.created_at
-            parsed = datetime.fromisoformat(latest.replace("Z", "+00:00"))
-            if parsed.tzinfo is None:
-                parsed = parsed.replace(tzinfo=timezone.utc)
-            entries.append((parsed.astimezone(timezone.utc), guide))
-        entries.sort(key=lambda pair: pair[0], reverse=True)
-        header = [
-            "<section class=\"page-header\">",
-            "<h1>Live changelog</h1>",
-            "<p>Follow every update we push into grabgifts.</p>",
-            "</section>",
-        ]
-        body_parts = header[:]
+            latest = self._guide_latest_iso(guide) or guide.created_at
+            entries.append((_parse_iso_datetime(latest), guide))
+        entries.sort(key=itemgetter(0), reverse=True)
         if entries:
             items = []
             for timestamp, guide in entries:
@@ -1399,34 +1950,44 @@ class SiteGenerator:
                     f"<a href=\"/guides/{guide.slug}/\">{display_title}</a>"
                     "</li>"
                 )
-            body_parts.append(
-                "<ul class=\"timeline\">"
-                + "\n".join(items)
-                + "</ul>"
-            )
+            timeline_html = "<ul class=\"timeline\">" + "\n".join(items) + "</ul>"
         else:
-            body_parts.append("<p>No changes logged yet.</p>")
+            timeline_html = "<p>No changes logged yet.</p>"
         html = self._render_document(
-            page_title=f"Live changelog – {self.settings.name}",
+            page_title="Live changelog",
+            with_site_name=True,
             description="Track the latest GrabGifts updates.",
             canonical_path="/changelog/",
-            body="\n".join(body_parts),
+            body=f"{_CHANGELOG_HEADER}\n{timeline_html}",
         )
         self._write_file("/changelog/index.html", html)
-        self._sitemap_entries.append(("/changelog/", datetime.now(timezone.utc).isoformat()))
+        self._sitemap_entries.append(("/changelog/", self._build_now_iso))
 
     def _write_categories(self, products: Sequence[Product]) -> None:
         categories: dict[tuple[str, str], List[Product]] = {}
+        latest_updates: dict[tuple[str, str], str] = {}
         for product in products:
             if not product.category:
                 continue
-            slug = slugify(product.category)
-            categories.setdefault((slug, product.category), []).append(product)
-        for (slug, name), items in sorted(categories.items(), key=lambda pair: pair[0][1].lower()):
-            ranked = sorted(items, key=_score_key, reverse=True)
+            key = (slugify(product.category), product.category)
+            items = categories.get(key)
+            if items is None:
+                categories[key] = [product]
+                latest_updates[key] = product.updated_at
+                continue
+            items.append(product)
+            if product.updated_at > latest_updates[key]:
+                latest_updates[key] = product.updated_at
+        ordered = [
+            (name.lower(), slug, name, items)
+            for (slug, name), items in categories.items()
+        ]
+        ordered.sort(key=itemgetter(0))
+        for _, slug, name, items in ordered:
+            top = sorted(items, key=_score_key, reverse=True)[:GUIDE_ITEM_TARGET]
             cards = []
             product_json = []
-            for product in ranked[:GUIDE_ITEM_TARGET]:
+            for product in top:
                 card = self._product_card(product)
                 if not card:
                     continue
@@ -1436,75 +1997,59 @@ class SiteGenerator:
             description = _strip_banned_phrases(
                 f"Trending picks from the {name} category updated daily."
             )
-            parts = [
-                "<section class=\"page-header\">",
-                f"<h1>{name}</h1>",
-                f"<p>{description}</p>",
-                "</section>",
-            ]
             if cards:
-                parts.extend(
-                    [
-                        "<section class=\"grid\">",
-                        "\n".join(cards),
-                        "</section>",
-                    ]
-                )
+                listing_html = "<section class=\"grid\">\n" + "\n".join(cards) + "\n</section>"
             else:
-                parts.append("<p>No items are available for this category right now.</p>")
-            body = "\n".join(parts)
+                listing_html = "<p>No items are available for this category right now.</p>"
+            body = (
+                "<section class=\"page-header\">\n"
+                f"<h1>{name}</h1>\n"
+                f"<p>{description}</p>\n"
+                "</section>\n"
+                f"{listing_html}"
+            )
             html = self._render_document(
-                page_title=f"{name} Gifts – {self.settings.name}",
+                page_title=f"{name} Gifts",
+                with_site_name=True,
                 description=description,
                 canonical_path=f"/categories/{slug}/",
                 body=body,
                 extra_json_ld=[
-                    {
-                        "@context": "https://schema.org",
-                        "@type": "ItemList",
-                        "name": f"{name} gifts",
-                        "itemListElement": [
-                            {
-                                "@type": "ListItem",
-                                "position": idx + 1,
-                                "name": product.title,
-                                "url": self._abs_url(f"/products/{product.slug}/"),
-                            }
-                        for idx, product in enumerate(ranked[:GUIDE_ITEM_TARGET])
-                        ],
-                    },
+                    self._item_list_json_ld(f"{name} gifts", top),
                     *product_json,
                 ],
             )
             self._write_file(f"/categories/{slug}/index.html", html)
-            latest = max(product.updated_at for product in items)
-            self._sitemap_entries.append((f"/categories/{slug}/", latest))
+            self._sitemap_entries.append(
+                (f"/categories/{slug}/", latest_updates[(slug, name)])
+            )
 
     def _write_products(self, products: Sequence[Product]) -> None:
+        entries: List[tuple[str, str]] = []
+        affiliate_url = self._affiliate_url
+        product_description = self._product_description
+        product_json_ld = self._product_json_ld_text
+        render = self._render_document
+        write = self._write_file
         for product in products:
-            description_source = product.description or _fallback_product_copy(product)
-            description = _strip_banned_phrases(description_source)
-            link = prepare_affiliate_url(product.url, product.source)
-            price_display = product.price_text
-            if not price_display and product.price is not None:
-                currency = product.currency or "USD"
-                if currency.upper() == "USD":
-                    price_display = f"${product.price:,.2f}"
-                else:
-                    price_display = f"{product.price:,.2f} {currency.upper()}"
+            description = product_description(product)
+            link = affiliate_url(product)
+            price_display = _price_display(
+                product.price_text, product.price, product.currency
+            )
             tags: list[str] = []
             if product.brand:
-                tags.append(html_escape(product.brand))
+                tags.append(_escape_cached(product.brand))
             if product.category:
-                tags.append(html_escape(product.category))
+                tags.append(_escape_cached(product.category))
             tags_html = (
                 "<ul class=\"product-card__tags\">"
                 + "".join(f"<li>{tag}</li>" for tag in tags)
-                + "</ul>"
+                + "</ul>\n"
             ) if tags else ""
 
             price_html = (
-                f"<p class=\"product-card__price\">{html_escape(price_display)}</p>"
+                f"<p class=\"product-card__price\">{html_escape(price_display)}</p>\n"
                 if price_display
                 else ""
             )
@@ -1514,7 +2059,7 @@ class SiteGenerator:
                 rating_value = f"{product.rating:.1f}".rstrip("0").rstrip(".")
                 reviews_html = ""
                 if product.rating_count and product.rating_count > 0:
-                    review_word = "review" if product.rating_count == 1 else "reviews"
+                    review_word = _plural(product.rating_count, "review", "reviews")
                     reviews_html = (
                         f"<span class=\"product-card__rating-count\">({product.rating_count:,} {review_word})</span>"
                     )
@@ -1523,48 +2068,35 @@ class SiteGenerator:
                     f"aria-label=\"Rated {rating_value} out of 5\">"
                     "<span class=\"product-card__rating-icon\" aria-hidden=\"true\">★</span>"
                     f"<span class=\"product-card__rating-score\">{rating_value}</span>"
-                    + reviews_html
-                    + "</div>"
+                    f"{reviews_html}"
+                    "</div>\n"
                 )
 
             retailer_label = _retailer_label(product.source)
             updated_label = _format_updated_label(product.updated_at)
             updated_html = (
-                f"<p class=\"product-card__updated\">Updated {html_escape(updated_label)}</p>"
+                f"<p class=\"product-card__updated\">Updated {html_escape(updated_label)}</p>\n"
                 if updated_label
                 else ""
             )
 
-            card_parts = ['<article class="product-card product-card--page">']
-            if product.image:
-                card_parts.append(
-                    "<div class=\"product-card__media\">"
-                    + f"<img src=\"{html_escape(product.image)}\" alt=\"{html_escape(product.title)}\" loading=\"lazy\">"
-                    + "</div>"
-                )
-            card_parts.append("<div class=\"product-card__body\">")
-            if tags_html:
-                card_parts.append(tags_html)
-            card_parts.append(
-                f"<h1 class=\"product-card__title\">{html_escape(product.title)}</h1>"
-            )
-            if price_html:
-                card_parts.append(price_html)
-            if rating_html:
-                card_parts.append(rating_html)
-            card_parts.append(
-                f"<p class=\"product-card__description\">{html_escape(description)}</p>"
-            )
+            title_html = html_escape(product.title)
+            media_html = (
+                "<div class=\"product-card__media\">"
+                f"<img src=\"{html_escape(product.image)}\" alt=\"{title_html}\" loading=\"lazy\">"
+                "</div>\n"
+            ) if product.image else ""
             feature_items = [feature for feature in product.features if feature.strip()]
+            features_html = ""
             if feature_items:
                 feature_list = "".join(
                     f"<li>{html_escape(feature)}</li>" for feature in feature_items
                 )
-                card_parts.append(
+                features_html = (
                     '<section class="product-card__section">'
                     '<h2 class="product-card__section-title">Key features</h2>'
                     f'<ul class="product-card__feature-list">{feature_list}</ul>'
-                    "</section>"
+                    "</section>\n"
                 )
             detail_items: list[str] = []
             if price_display:
@@ -1590,48 +2122,58 @@ class SiteGenerator:
                 detail_items.append(
                     "<li class=\"product-card__detail-item\">"
                     "<span class=\"product-card__detail-label\">Brand</span>"
-                    f"<span class=\"product-card__detail-value\">{html_escape(product.brand)}</span>"
+                    f"<span class=\"product-card__detail-value\">{_escape_cached(product.brand)}</span>"
                     "</li>"
                 )
             if product.category:
                 detail_items.append(
                     "<li class=\"product-card__detail-item\">"
                     "<span class=\"product-card__detail-label\">Category</span>"
-                    f"<span class=\"product-card__detail-value\">{html_escape(product.category)}</span>"
+                    f"<span class=\"product-card__detail-value\">{_escape_cached(product.category)}</span>"
                     "</li>"
                 )
             if retailer_label:
                 detail_items.append(
                     "<li class=\"product-card__detail-item\">"
                     "<span class=\"product-card__detail-label\">Retailer</span>"
-                    f"<span class=\"product-card__detail-value\">{html_escape(retailer_label)}</span>"
+                    f"<span class=\"product-card__detail-value\">{_escape_cached(retailer_label)}</span>"
                     "</li>"
                 )
-            if detail_items:
-                card_parts.append(
-                    '<section class="product-card__section">'
-                    '<h2 class="product-card__section-title">At a glance</h2>'
-                    f'<ul class="product-card__detail-list">{"".join(detail_items)}</ul>'
-                    "</section>"
-                )
-            card_parts.append(
+            details_html = (
+                '<section class="product-card__section">'
+                '<h2 class="product-card__section-title">At a glance</h2>'
+                f'<ul class="product-card__detail-list">{"".join(detail_items)}</ul>'
+                "</section>\n"
+            ) if detail_items else ""
+            body = (
+                '<article class="product-card product-card--page">\n'
+                f"{media_html}"
+                "<div class=\"product-card__body\">\n"
+                f"{tags_html}"
+                f"<h1 class=\"product-card__title\">{title_html}</h1>\n"
+                f"{price_html}"
+                f"{rating_html}"
+                f"<p class=\"product-card__description\">{html_escape(description)}</p>\n"
+                f"{features_html}"
+                f"{details_html}"
                 "<a class=\"button product-card__cta\" "
-                f"rel=\"{affiliate_rel()}\" target=\"_blank\" href=\"{html_escape(link)}\">Shop now</a>"
+                f"rel=\"{_AFF_REL}\" target=\"_blank\" href=\"{html_escape(link)}\">Shop now</a>\n"
+                f"{updated_html}"
+                "</div>\n"
+                "</article>"
             )
-            if updated_html:
-                card_parts.append(updated_html)
-            card_parts.append("</div>")
-            card_parts.append("</article>")
-            body = "\n".join(card_parts)
-            html = self._render_document(
-                page_title=f"{product.title} – {self.settings.name}",
+            path = f"/products/{product.slug}/"
+            html = render(
+                page_title=product.title,
+                with_site_name=True,
                 description=description,
-                canonical_path=f"/products/{product.slug}/",
+                canonical_path=path,
                 body=body,
-                extra_json_ld=[self._product_json_ld(product, description)],
+                extra_json_ld=[product_json_ld(product, description)],
             )
-            self._write_file(f"/products/{product.slug}/index.html", html)
-            self._sitemap_entries.append((f"/products/{product.slug}/", product.updated_at))
+            write(f"{path}index.html", html)
+            entries.append((path, product.updated_at))
+        self._sitemap_entries.extend(entries)
 
     def _build_category_options(self, products: Sequence[Product]) -> list[str]:
         counts: dict[str, int] = {}
@@ -1702,24 +2244,11 @@ class SiteGenerator:
 
     def _render_product_catalog(
         self, cards: Sequence[str], products: Sequence[Product]
-    ) -> list[str]:
+    ) -> str:
         total = len(cards)
-        summary_text = f"Showing {total:,} of {total:,} products"
-        summary_id = "product-results-summary"
         category_options = self._build_category_options(products)
         price_options = self._build_price_options(products)
-        parts: list[str] = ['<section class="product-catalog" data-product-catalog>']
-        parts.extend(
-            [
-                '  <div class="product-catalog__controls">',
-                '    <form class="product-filters" data-product-form>',
-                '      <div class="product-filters__fields">',
-                '        <div class="product-filters__group product-filters__group--search">',
-                '          <label class="product-filters__label" for="product-search">Search</label>',
-                '          <input class="product-filters__input" type="search" id="product-search" name="search" placeholder="Search by product, brand, or keyword" autocomplete="off" spellcheck="false" aria-describedby="product-results-summary" data-product-search>',
-                '        </div>',
-            ]
-        )
+        parts: list[str] = [_CATALOG_CONTROLS_OPEN]
         if category_options:
             parts.append('        <div class="product-filters__group">')
             parts.append('          <label class="product-filters__label" for="product-category">Category</label>')
@@ -1734,48 +2263,29 @@ class SiteGenerator:
             parts.extend(f"            {option}" for option in price_options)
             parts.append('          </select>')
             parts.append('        </div>')
-        parts.extend(
-            [
-                '      </div>',
-                '      <div class="product-filters__actions">',
-                '        <button type="reset" class="button button-ghost product-filters__reset">Clear filters</button>',
-                '      </div>',
-                '    </form>',
-                f'    <p class="product-filters__summary" id="{summary_id}" data-product-summary aria-live="polite">{summary_text}</p>',
-                '  </div>',
-                '  <section class="feed-section product-catalog__results">',
-                f'    <div class="feed-list" data-product-grid data-product-total="{total}">',
-            ]
-        )
-        parts.extend(f"      {card}" for card in cards)
-        parts.extend(
-            [
-                '    </div>',
-                '  </section>',
-                '  <p class="product-catalog__empty" data-product-empty aria-live="polite" hidden>No products match your filters yet. Try adjusting or clearing the filters.</p>',
-                '</section>',
-            ]
+        parts.append(
+            _CATALOG_RESULTS_TEMPLATE.format(
+                summary_text=f"Showing {total:,} of {total:,} products",
+                total=total,
+                cards="      " + "\n      ".join(cards),
+            )
         )
-        return parts
+        return "\n".join(parts)
 
     def _write_products_index(self, products: Sequence[Product]) -> None:
-        header = [
-            '<section class="page-header">',
-            '<h1>All products</h1>',
-            '<p>Every grabgifts find in one catalog. Use the filters below to zero in on the perfect gift fast.</p>',
-            '</section>',
-        ]
-        sorted_products = sorted(
-            products,
-            key=lambda item: (
+        decorated = [
+            (
                 max(
-                    _parse_iso_datetime(item.created_at),
-                    _parse_iso_datetime(item.updated_at),
+                    _iso_timestamp(product.created_at),
+                    _iso_timestamp(product.updated_at),
                 ),
-                item.title.lower() if item.title else "",
-            ),
-            reverse=True,
-        )
+                product.title.lower() if product.title else "",
+                product,
+            )
+            for product in products
+        ]
+        decorated.sort(key=itemgetter(0, 1), reverse=True)
+        sorted_products = [product for _, _, product in decorated]
         cards: list[str] = []
         for product in sorted_products:
             card = self._product_preview_card(product)
@@ -1783,45 +2293,47 @@ class SiteGenerator:
                 continue
             cards.append(card)
 
-        body_parts = header[:]
         if cards:
-            body_parts.extend(self._render_product_catalog(cards, sorted_products))
+            catalog = self._render_product_catalog(cards, sorted_products)
         else:
-            body_parts.append("<p>No products are available right now.</p>")
+            catalog = "<p>No products are available right now.</p>"
 
         html = self._render_document(
-            page_title=f"Products – {self.settings.name}",
+            page_title="Products",
+            with_site_name=True,
             description="Browse every product in the GrabGifts catalog with fast category, price, and keyword filters.",
             canonical_path="/products/",
-            body="\n".join(body_parts),
+            body=_PRODUCTS_INDEX_TEMPLATE.format(catalog=catalog),
         )
         self._write_file("/products/index.html", html)
-        latest = max(
-            (
-                max(
-                    _parse_iso_datetime(product.created_at),
-                    _parse_iso_datetime(product.updated_at),
-                )
-                for product in sorted_products
-            ),
-            default=datetime.now(timezone.utc),
-        )
+        if sorted_products:
+            newest = sorted_products[0]
+            latest = max(
+                _parse_iso_datetime(newest.created_at),
+                _parse_iso_datetime(newest.updated_at),
+            )
+        else:
+            latest = self._build_now
         self._sitemap_entries.append(("/products/", latest.isoformat()))
 
     def _write_about(self, guides: Sequence[Guide], products: Sequence[Product]) -> None:
         live_guides = [guide for guide in guides if guide.products]
         live_count = len(live_guides)
         total_products = len(products)
-        category_counts = Counter(
-            product.category for product in products if product.category
-        )
-        category_count = len([name for name in category_counts])
-        brand_count = len({product.brand for product in products if product.brand})
+        category_counts: Counter[str] = Counter()
+        brands: set[str] = set()
+        for product in products:
+            if product.category:
+                category_counts[product.category] += 1
+            if product.brand:
+                brands.add(product.brand)
+        category_count = len(category_counts)
+        brand_count = len(brands)
         top_categories = [name for name, _ in category_counts.most_common(3)]
         stats_cards: list[str] = []
         if live_count:
-            guide_label = "guides" if live_count != 1 else "guide"
-            verb = "regenerate" if live_count != 1 else "regenerates"
+            guide_label = _plural(live_count, "guide", "guides")
+            verb = _plural(live_count, "regenerates", "regenerate")
             refresh_text = (
                 f"{live_count:,} {guide_label} {verb} before most people finish their first coffee."
             )
@@ -1839,10 +2351,10 @@ class SiteGenerator:
         if total_products:
             coverage_bits.append(f"{total_products:,} gift ideas tracked")
         if category_count:
-            category_label = "categories" if category_count != 1 else "category"
+            category_label = _plural(category_count, "category", "categories")
             coverage_bits.append(f"{category_count} {category_label} monitored")
         if brand_count:
-            brand_label = "brands" if brand_count != 1 else "brand"
+            brand_label = _plural(brand_count, "brand", "brands")
             coverage_bits.append(f"{brand_count:,} {brand_label} represented")
         if coverage_bits:
             coverage_text = _join_with_and(coverage_bits)
@@ -1857,211 +2369,66 @@ class SiteGenerator:
             f"<p>{coverage_text}</p>"
             "</article>"
         )
-        stats_cards.append(
-            "<article class=\"quality-card\">"
-            "<h3>Editorial guardrails</h3>"
-            "<p>Every pick ships with human-written copy, duplicate scrubbing, and pricing context before it goes live.</p>"
-            "</article>"
-        )
+        stats_cards.append(_ABOUT_GUARDRAILS_CARD)
         if top_categories:
-            escaped = [html_escape(name) for name in top_categories]
+            escaped = [_escape_cached(name) for name in top_categories]
             categories_text = _join_with_and(escaped)
-            verb = "lead" if len(escaped) != 1 else "leads"
+            verb = _plural(len(escaped), "leads", "lead")
             stats_cards.append(
                 "<article class=\"quality-card\">"
                 "<h3>Trending themes</h3>"
                 f"<p>{categories_text} currently {verb} the click-through charts.</p>"
                 "</article>"
             )
-        mission_cards = [
-            (
-                "<article class=\"card\">"
-                "<h3>What you'll find</h3>"
-                f"<p>Each guide showcases {GUIDE_ITEM_TARGET} standout gifts with pricing context, verified imagery, and quick-scan blurbs.</p>"
-                "</article>"
-            ),
-            (
-                "<article class=\"card\">"
-                "<h3>Signals we monitor</h3>"
-                "<p>Release calendars, retailer feeds, review velocity, and community chatter all factor into our selections.</p>"
-                "</article>"
-            ),
-            (
-                "<article class=\"card\">"
-                "<h3>Automation plus humans</h3>"
-                "<p>Scripted pipelines flag promising items while editors trim the noise, rewrite copy, and ensure merchandising stays sharp.</p>"
-                "</article>"
-            ),
-        ]
+        mission_cards = _ABOUT_MISSION_CARDS
         if category_count and top_categories:
-            category_label = "categories" if category_count != 1 else "category"
-            highlighted = _join_with_and([html_escape(name) for name in top_categories])
-            focus_verb = "are" if len(top_categories) != 1 else "is"
-            mission_cards.append(
-                "<article class=\"card\">"
+            category_label = _plural(category_count, "category", "categories")
+            highlighted = _join_with_and([_escape_cached(name) for name in top_categories])
+            focus_verb = _plural(len(top_categories), "is", "are")
+            mission_cards += (
+                "\n<article class=\"card\">"
                 "<h3>Where we focus</h3>"
                 f"<p>We constantly rotate through {category_count} {category_label}, with {highlighted} {focus_verb} resonating right now.</p>"
                 "</article>"
             )
-        cta_links = [
-            "<li><a href=\"/guides/\">Browse today's guides</a></li>",
-            "<li><a href=\"/how-we-curate/\">See how we curate</a></li>",
-            "<li><a href=\"/contact/\">Reach the team</a></li>",
-        ]
-        body_parts = [
-            "<section class=\"page-header\">",
-            "<h1>About grabgifts</h1>",
-            "<p>grabgifts is a small editorial studio tracking giftable finds with automation, data, and a human edit pass.</p>",
-            "</section>",
-            "<section class=\"quality-section\" aria-labelledby=\"about-highlights\">",
-            "<div class=\"page-header\">",
-            "<h2 id=\"about-highlights\">What drives the project</h2>",
-            "<p>Metrics, manual curation, and constant iteration keep the catalog trustworthy.</p>",
-            "</div>",
-            "<div class=\"quality-grid\">",
-            "".join(stats_cards),
-            "</div>",
-            "</section>",
-            "<section>",
-            "<div class=\"page-header\">",
-            "<h2>How we work</h2>",
-            "<p>Automation handles the heavy lifting while editors focus on storytelling and product fit.</p>",
-            "</div>",
-            "<div class=\"grid\">",
-            "\n".join(mission_cards),
-            "</div>",
-            "</section>",
-            "<section>",
-            "<div class=\"page-header\">",
-            "<h2>Explore more</h2>",
-            "<p>Jump into the latest guides or learn more about our process.</p>",
-            "</div>",
-            f"<ul class=\"link-list\">{''.join(cta_links)}</ul>",
-            "</section>",
-        ]
         html = self._render_document(
             page_title=f"About {self.settings.name}",
             description=f"Meet the {self.settings.name} team and see how we scout giftable products.",
             canonical_path="/about/",
-            body="\n".join(body_parts),
+            body=_ABOUT_TEMPLATE.format(
+                stats_cards="".join(stats_cards),
+                mission_cards=mission_cards,
+            ),
         )
         self._write_file("/about/index.html", html)
-        self._sitemap_entries.append(("/about/", datetime.now(timezone.utc).isoformat()))
+        self._sitemap_entries.append(("/about/", self._build_now_iso))
 
     def _write_curation_page(
         self, guides: Sequence[Guide], products: Sequence[Product]
     ) -> None:
         total_products = len(products)
         guide_count = len(guides)
-        signals = [
-            (
-                "<article class=\"quality-card\">"
-                "<h3>Inventory sweep</h3>"
-                "<p>Marketplace APIs and curated retailer feeds pipe in promising items with pricing, imagery, and metadata.</p>"
-                "</article>"
-            ),
-            (
-                "<article class=\"quality-card\">"
-                "<h3>Signal scoring</h3>"
-                "<p>We weigh release timing, review velocity, price movement, and gifting fit to rank every product candidate.</p>"
-                "</article>"
-            ),
-            (
-                "<article class=\"quality-card\">"
-                "<h3>Editorial pass</h3>"
-                f"<p>Editors fact-check availability, write blurbs, and assemble {GUIDE_ITEM_TARGET}-item lineups ready for syndication.</p>"
-                "</article>"
-            ),
-        ]
-        guardrails = [
-            (
-                "<article class=\"card\">"
-                "<h3>Duplication control</h3>"
-                "<p>IDs, URLs, and titles are normalized so repeats never sneak into a guide.</p>"
-                "</article>"
-            ),
-            (
-                "<article class=\"card\">"
-                "<h3>Price monitoring</h3>"
-                "<p>We refresh price data daily and surface shifts that change the recommendation.</p>"
-                "</article>"
-            ),
-            (
-                "<article class=\"card\">"
-                "<h3>Compliance ready</h3>"
-                "<p>Affiliate rel attributes, sponsored disclosures, and JSON-LD ship in every build.</p>"
-                "</article>"
-            ),
-        ]
-        timeline_entries = [
-            ("07:00", "Automation syncs pricing, inventory status, and new arrivals."),
-            ("11:00", "Editors review flagged products and slot new standouts into guides."),
-            ("15:00", "Guides regenerate, metadata refreshes, and the static site deploys."),
-        ]
-        timeline_markup = []
-        for label, description in timeline_entries:
-            timeline_markup.append(
-                "<li>"
-                f"<time datetime=\"{label}\">{label} UTC</time>"
-                f"<span>{description}</span>"
-                "</li>"
-            )
         summary_bits: list[str] = []
         if guide_count:
-            guide_label = "guides" if guide_count != 1 else "guide"
+            guide_label = _plural(guide_count, "guide", "guides")
             summary_bits.append(f"{guide_count} {guide_label} in rotation")
         if total_products:
-            product_label = "products" if total_products != 1 else "product"
+            product_label = _plural(total_products, "product", "products")
             summary_bits.append(f"{total_products:,} {product_label} scored")
         summary_text = " and ".join(summary_bits) if summary_bits else "Our pipeline hums along even when inventory is light"
-        body_parts = [
-            "<section class=\"page-header\">",
-            "<h1>How we curate</h1>",
-            f"<p>{summary_text}. Here's how the workflow runs end to end.</p>",
-            "</section>",
-            "<section class=\"quality-section\" aria-labelledby=\"curation-steps\">",
-            "<div class=\"page-header\">",
-            "<h2 id=\"curation-steps\">Three phases keep quality high</h2>",
-            "<p>Automation narrows the field, scoring ranks the contenders, and editors finalize every recommendation.</p>",
-            "</div>",
-            "<div class=\"quality-grid\">",
-            "".join(signals),
-            "</div>",
-            "</section>",
-            "<section>",
-            "<div class=\"page-header\">",
-            "<h2>Daily publishing rhythm</h2>",
-            "<p>Each build runs on a repeatable schedule so updates land like clockwork.</p>",
-            "</div>",
-            "<ul class=\"timeline\">",
-            "".join(timeline_markup),
-            "</ul>",
-            "</section>",
-            "<section>",
-            "<div class=\"page-header\">",
-            "<h2>Quality guardrails</h2>",
-            "<p>Checks fire on every run to catch anything that could erode trust.</p>",
-            "</div>",
-            "<div class=\"grid\">",
-            "\n".join(guardrails),
-            "</div>",
-            "</section>",
-            "<section>",
-            "<div class=\"page-header\">",
-            "<h2>Need something else?</h2>",
-            "<p>Reach out if you want to collaborate, request coverage, or surface feedback.</p>",
-            "</div>",
-            "<ul class=\"link-list\"><li><a href=\"/contact/\">Contact the editors</a></li><li><a href=\"/about/\">Learn about grabgifts</a></li></ul>",
-            "</section>",
-        ]
         html = self._render_document(
             page_title=f"How {self.settings.name} curates",
             description=f"Understand the scoring pipeline and editorial guardrails that power {self.settings.name}.",
             canonical_path="/how-we-curate/",
-            body="\n".join(body_parts),
+            body=_CURATION_TEMPLATE.format(
+                summary_text=summary_text,
+                signals=_CURATION_SIGNALS,
+                timeline=_CURATION_TIMELINE,
+                guardrails=_CURATION_GUARDRAILS,
+            ),
         )
         self._write_file("/how-we-curate/index.html", html)
-        self._sitemap_entries.append(("/how-we-curate/", datetime.now(timezone.utc).isoformat()))
+        self._sitemap_entries.append(("/how-we-curate/", self._build_now_iso))
 
     def _write_contact(self) -> None:
         contact_email = self.settings.contact_email or "support@grabgifts.net"
@@ -2090,172 +2457,105 @@ class SiteGenerator:
                 + html_escape(facebook_url)
                 + "\" target=\"_blank\" rel=\"noopener\">Follow along on Facebook</a></li>"
             )
-        link_items = [
-            f"<li><a href=\"{contact_href}\">Email {contact_label}</a></li>",
-            "<li><a href=\"/faq/\">Review our FAQ &amp; disclosure</a></li>",
-            "<li><a href=\"/guides/\">Catch today's guides</a></li>",
-        ]
-        link_items.extend(social_links)
-        support_cards = [
-            (
-                "<article class=\"quality-card\">"
-                "<h3>Partnerships &amp; pitches</h3>"
-                "<p>Share launch timelines, exclusive bundles, or affiliate-ready drops you'd like us to evaluate.</p>"
-                "</article>"
-            ),
-            (
-                "<article class=\"quality-card\">"
-                "<h3>Corrections</h3>"
-                "<p>See an item go out of stock or pricing that drifted? Send the details and we will rerun the checks.</p>"
-                "</article>"
-            ),
-            (
-                "<article class=\"quality-card\">"
-                "<h3>Press &amp; inquiries</h3>"
-                "<p>Need a quote about gifting trends or our automation stack? Drop a note and we will respond quickly.</p>"
-                "</article>"
-            ),
-        ]
-        expectations_cards = [
-            (
-                "<article class=\"card\">"
-                "<h3>Response time</h3>"
-                "<p>We aim to reply within one business day, often sooner when a launch is in motion.</p>"
-                "</article>"
-            ),
-            (
-                "<article class=\"card\">"
-                "<h3>What to include</h3>"
-                "<p>Links, pricing, regional availability, and any embargo dates help us act fast.</p>"
-                "</article>"
-            ),
-        ]
-        body_parts = [
-            "<section class=\"page-header\">",
-            "<h1>Contact the grabgifts editors</h1>",
-            "<p>We love hearing about new products, partnerships, and feedback from shoppers.</p>",
-            "</section>",
-            "<section class=\"quality-section\" aria-labelledby=\"contact-topics\">",
-            "<div class=\"page-header\">",
-            "<h2 id=\"contact-topics\">How we can help</h2>",
-            "<p>Pick the lane that matches what you need and we will route it to the right editor.</p>",
-            "</div>",
-            "<div class=\"quality-grid\">",
-            "".join(support_cards),
-            "</div>",
-            "</section>",
-            "<section>",
-            "<div class=\"page-header\">",
-            "<h2>Reach us quickly</h2>",
-            "<p>Choose the channel that works best for you.</p>",
-            "</div>",
-            f"<ul class=\"link-list\">{''.join(link_items)}</ul>",
-            "</section>",
-            "<section>",
-            "<div class=\"page-header\">",
-            "<h2>Set expectations</h2>",
-            "<p>A little prep goes a long way and keeps the catalog clean.</p>",
-            "</div>",
-            "<div class=\"grid\">",
-            "\n".join(expectations_cards),
-            "</div>",
-            "</section>",
-        ]
+        link_items = (
+            f"<li><a href=\"{contact_href}\">Email {contact_label}</a></li>"
+            + _CONTACT_STATIC_LINKS
+            + "".join(social_links)
+        )
         html = self._render_document(
             page_title=f"Contact {self.settings.name}",
             description=f"Get in touch with the {self.settings.name} editors for partnerships, tips, or support.",
             canonical_path="/contact/",
-            body="\n".join(body_parts),
+            body=_CONTACT_TEMPLATE.format(
+                support_cards=_CONTACT_SUPPORT_CARDS,
+                link_items=link_items,
+                expectations_cards=_CONTACT_EXPECTATIONS_CARDS,
+            ),
         )
         self._write_file("/contact/index.html", html)
-        self._sitemap_entries.append(("/contact/", datetime.now(timezone.utc).isoformat()))
+        self._sitemap_entries.append(("/contact/", self._build_now_iso))
 
     def _write_faq(self) -> None:
         contact_email = self.settings.contact_email or "support@grabgifts.net"
         contact_label = html_escape(contact_email)
         contact_href = html_escape(f"mailto:{contact_email}")
-        body = "\n".join(
-            [
-                "<h1>Affiliate disclosure</h1>",
-                "<p>GrabGifts may earn commissions from qualifying purchases made through outbound links. We only feature items that fit our curated guides.</p>",
-                f"<p>Questions? Contact us at <a href=\"{contact_href}\">{contact_label}</a>.</p>",
-            ]
-        )
         html = self._render_document(
             page_title="Affiliate disclosure",
             description="Affiliate disclosure",
             canonical_path="/faq/",
-            body=body,
+            body=_FAQ_TEMPLATE.format(
+                contact_href=contact_href, contact_label=contact_label
+            ),
         )
         self._write_file("/faq/index.html", html)
-        self._sitemap_entries.append(("/faq/", datetime.now(timezone.utc).isoformat()))
+        self._sitemap_entries.append(("/faq/", self._build_now_iso))
 
     # ------------------------------------------------------------------
     # Static assets
 
     def _write_sitemap(self) -> None:
-        entries = [
-            "<?xml version=\"1.0\" encoding=\"UTF-8\"?>",
-            "<urlset xmlns=\"http://www.sitemaps.org/schemas/sitemap/0.9\">",
-        ]
-        for path, lastmod in self._sitemap_entries:
-            entries.append("<url>")
-            entries.append(f"<loc>{self._abs_url(path)}</loc>")
-            entries.append(f"<lastmod>{lastmod}</lastmod>")
-            entries.append("</url>")
-        entries.append("</urlset>")
-        self._safe_write(self.output_dir / "sitemap.xml", "\n".join(entries))
+        abs_url = self._abs_url
+        chunks = [_SITEMAP_HEADER]
+        chunks.extend(
+            f"<url>\n<loc>{abs_url(path)}</loc>\n<lastmod>{lastmod}</lastmod>\n</url>\n"
+            for path, lastmod in self._sitemap_entries
+        )
+        chunks.append("</urlset>")
+        # Section pages stamp the build time as lastmod, so the sitemap differs
+        # on every build and a read-compare would never pay off.
+        self._submit_write(
+            self._safe_write_chunks,
+            self.output_dir / "sitemap.xml",
+            chunks,
+            skip_unchanged=False,
+        )
 
     def _write_robots(self) -> None:
         content = (
             "User-agent: *\nAllow: /\n"
             f"Sitemap: {self._abs_url('/sitemap.xml')}\n"
         )
-        self._safe_write(self.output_dir / "robots.txt", content)
+        self._submit_write(self._safe_write, self.output_dir / "robots.txt", content)
 
     def _write_rss(self, guides: Sequence[Guide]) -> None:
         base = self._abs_url("/")
-        items: List[str] = []
-        for guide in guides[:20]:
-            link = self._abs_url(f"/guides/{guide.slug}/")
-            description = guide.description
-            display_title = polish_guide_title(guide.title)
-            items.append(
-                "<item>"
-                f"<title>{display_title}</title>"
-                f"<link>{link}</link>"
-                f"<guid>{link}</guid>"
-                f"<description><![CDATA[{description}]]></description>"
-                f"<pubDate>{_format_rfc2822(guide.created_at)}</pubDate>"
-                "</item>"
-            )
-        rss = (
+        published_fallback = self._build_now
+        feed_guides = [
+            (guide, self._abs_url(f"/guides/{guide.slug}/")) for guide in guides[:20]
+        ]
+        channel_open = (
             "<?xml version=\"1.0\" encoding=\"UTF-8\"?>"
             "<rss version=\"2.0\"><channel>"
             f"<title>{self.settings.name}</title>"
             f"<link>{base}</link>"
             f"<description>{self.settings.description}</description>"
-            f"{''.join(items)}"
-            "</channel></rss>"
         )
-        self._safe_write(self.output_dir / "rss.xml", rss)
+        chunks = [channel_open]
+        chunks.extend(
+            "<item>"
+            f"<title>{polish_guide_title(guide.title)}</title>"
+            f"<link>{link}</link>"
+            f"<guid>{link}</guid>"
+            f"<description><![CDATA[{guide.description}]]></description>"
+            f"<pubDate>{_format_rfc2822(_parse_iso_datetime(guide.created_at), published_fallback)}</pubDate>"
+            "</item>"
+            for guide, link in feed_guides
+        )
+        chunks.append("</channel></rss>")
+        self._submit_write(self._safe_write_chunks, self.output_dir / "rss.xml", chunks)
 
 
-def _format_rfc2822(iso_date: str) -> str:
-    try:
-        dt = datetime.fromisoformat(iso_date)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S +0000")
-    except Exception:  # pragma: no cover - invalid dates
-        return datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S +0000")
+@lru_cache(maxsize=4096)
+def _format_rfc2822(value: datetime, fallback: datetime) -> str:
+    if value <= _MIN_TIMESTAMP:  # invalid dates parse to the sentinel
+        value = fallback
+    return value.strftime("%a, %d %b %Y %H:%M:%S +0000")
 
 
 def _score_key(product: Product) -> tuple:
     rating = float(product.rating or 0.0)
     reviews = int(product.rating_count or 0)
-    try:
-        updated = datetime.fromisoformat(product.updated_at).timestamp()
-    except Exception:
+    updated = _iso_timestamp(product.updated_at)
+    if updated <= _MIN_EPOCH:
         updated = 0.0
     return (rating, reviews, updated)
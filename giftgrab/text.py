@@ -10,6 +10,8 @@ _BAD_PHRASES = re.compile(
     r"(\bfree shipping\b|\bbuy now\b|\bbest\b|🔥|💥|⭐️|🚀)",
     re.IGNORECASE,
 )
+_TITLE_TOKEN_SPLIT = re.compile(r"(\s+|-|/)")
+_WHITESPACE = re.compile(r"\s+")
 
 
 def clamp(value: str, limit: int) -> str:
@@ -38,7 +40,7 @@ def title_case(value: str) -> str:
             return word
         return word[0].upper() + word[1:].lower()
 
-    words = re.split(r"(\s+|-|/)", value)
+    words = _TITLE_TOKEN_SPLIT.split(value)
     converted: List[str] = []
     for token in words:
         if token.strip() and not token.isspace() and token not in {"-", "/"}:
@@ -62,9 +64,9 @@ def dedupe_brand(name: str, brand: Optional[str]) -> str:
 def clean_text(value: str) -> str:
     """Collapse whitespace and remove banned phrases or emoji."""
 
-    collapsed = re.sub(r"\s+", " ", value or "").strip()
+    collapsed = _WHITESPACE.sub(" ", value or "").strip()
     cleaned = _BAD_PHRASES.sub("", collapsed)
-    return re.sub(r"\s+", " ", cleaned).strip()
+    return _WHITESPACE.sub(" ", cleaned).strip()
 
 
 @dataclass
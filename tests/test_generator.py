@@ -1,4 +1,15 @@
-from giftgrab.generator import SiteGenerator, polish_guide_title
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from giftgrab.generator import (
+    BASE_TEMPLATE_PATH,
+    SiteGenerator,
+    _strip_banned_phrases,
+    polish_guide_title,
+)
 from giftgrab.config import DEFAULT_CATEGORIES
 from giftgrab.models import Product
 from giftgrab.repository import ProductRepository
@@ -87,6 +98,10 @@ def test_generator_outputs_required_files(tmp_path, monkeypatch):
     assert any(
         product.title in fragment for product in stored_products if product.source == "ebay"
     )
+    source = index_html.split("data-product-source>", 1)[1].split("</script>", 1)[0]
+    remaining_cards = json.loads(source)
+    assert remaining_cards
+    assert all(card.startswith("<article") for card in remaining_cards)
     assert "Trending categories" in index_html
     assert "category-card__link" in index_html
 
@@ -100,3 +115,85 @@ def test_generator_outputs_required_files(tmp_path, monkeypatch):
 def test_polish_guide_title_removes_for_a_and_right_now():
     cleaned = polish_guide_title("Best For A Techy Gifts Right Now")
     assert cleaned == "Best Tech Gifts"
+
+
+def test_strip_banned_phrases_removes_every_phrase_case_insensitively():
+    text = "  Fresh Drops for ACTIVE VIBES and fresh drops  "
+    assert _strip_banned_phrases(text) == "for  and"
+
+
+def test_item_list_json_ld_matches_schema_payload(tmp_path):
+    generator = SiteGenerator(output_dir=tmp_path / "public")
+    products = sample_products()[:3]
+    products[0].title = "Mugs </script> & more"
+    encoded = generator._item_list_json_ld("Desk gifts", products, url="https://example.com/g/")
+    assert "</" not in encoded
+    assert json.loads(encoded) == {
+        "@context": "https://schema.org",
+        "@type": "ItemList",
+        "name": "Desk gifts",
+        "itemListElement": [
+            {
+                "@type": "ListItem",
+                "position": position,
+                "name": product.title,
+                "url": generator._abs_url(f"/products/{product.slug}/"),
+            }
+            for position, product in enumerate(products, start=1)
+        ],
+        "url": "https://example.com/g/",
+    }
+
+
+def test_safe_write_refuses_protected_layout_files(tmp_path):
+    generator = SiteGenerator(output_dir=tmp_path / "public")
+    with pytest.raises(RuntimeError):
+        generator._safe_write(BASE_TEMPLATE_PATH, "<html></html>")
+
+    link = tmp_path / "public" / "linked" / "index.html"
+    link.parent.mkdir(parents=True)
+    link.symlink_to(BASE_TEMPLATE_PATH)
+    with pytest.raises(RuntimeError):
+        generator._safe_write(link, "<html></html>")
+
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda generator, target, text: generator._safe_write(target, f"<p>{text}</p>"),
+        lambda generator, target, text: generator._safe_write_chunks(target, ["<p>", text, "</p>"]),
+    ],
+    ids=["_safe_write", "_safe_write_chunks"],
+)
+def test_writers_leave_unchanged_files_alone(tmp_path, write):
+    generator = SiteGenerator(output_dir=tmp_path / "public")
+    target = tmp_path / "public" / "page" / "index.html"
+    write(generator, target, "café")
+    os.utime(target, ns=(1, 1))
+    write(generator, target, "café")
+    assert target.stat().st_mtime_ns == 1
+    write(generator, target, "cafe")
+    assert target.read_text(encoding="utf-8") == "<p>cafe</p>"
+
+
+def test_submit_write_keeps_last_write_per_path(tmp_path):
+    generator = SiteGenerator(output_dir=tmp_path / "public")
+    target = tmp_path / "public" / "categories" / "home-kitchen" / "index.html"
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        generator._write_pool = pool
+        for index in range(50):
+            generator._submit_write(generator._safe_write, target, f"<p>{index}</p>" * (50 - index))
+        generator._finish_writes()
+        generator._write_pool = None
+    assert target.read_text(encoding="utf-8") == "<p>49</p>"
+
+
+def test_finish_writes_raises_failed_write(tmp_path):
+    generator = SiteGenerator(output_dir=tmp_path / "public")
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        generator._write_pool = pool
+        generator._submit_write(generator._safe_write, BASE_TEMPLATE_PATH, "<html></html>")
+        with pytest.raises(RuntimeError):
+            generator._finish_writes()
+        generator._write_pool = None
+